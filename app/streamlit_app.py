@@ -1,6 +1,8 @@
 import os
+import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from contextlib import closing
 import glob
 import yaml
 import pandas as pd
@@ -8,6 +10,12 @@ import streamlit as st
 import plotly.express as px
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.features import rollups
+from src.features.time_windows import resample_mean
+from src.io import storage, search_index
+from src.processing import assets as _assets
+
 CFG = ROOT / "config"
 
 def load_yaml(p):
@@ -22,18 +30,23 @@ DATA_DIR = ROOT / app_cfg["paths"]["data_root"]
 NEWS_DIR = DATA_DIR / "news"
 SENT_DIR = DATA_DIR / "sentiment"
 PRICE_DIR = DATA_DIR / "prices"
+ASSETS = _assets.from_config(data_cfg)
+DEFAULT_ASSET = _assets.default_name(ASSETS)
 
 st.set_page_config(page_title=app_cfg["title"], layout="wide")
 st.title(app_cfg["title"])
 st.caption(app_cfg["subtitle"])
 
-col1, col2, col3 = st.columns(3)
+col1, col2, col3, col4 = st.columns(4)
 with col1:
     lookback = st.slider("Lookback (minutes)", 15, 240, model_cfg["prediction"]["lookback_minutes"], step=15)
 with col2:
     resample = st.selectbox("Resample", ["5min","15min","30min","60min"], index=2)
 with col3:
     date_str = st.date_input("Date", datetime.now()).strftime("%Y-%m-%d")
+with col4:
+    names = [a.name for a in ASSETS]
+    asset = st.selectbox("Asset", names, index=names.index(DEFAULT_ASSET))
 
 def load_latest_sentiment(date_str: str) -> pd.DataFrame | None:
     patt = str(SENT_DIR / f"sentiment_analysis_{date_str}.csv")
@@ -52,10 +65,10 @@ def load_latest_sentiment(date_str: str) -> pd.DataFrame | None:
         df["weighted_sentiment"] = df["sentiment"] * df["confidence"]
     return df
 
-def load_latest_price(date_str: str) -> pd.DataFrame | None:
-    patt_new = str(PRICE_DIR / f"bitcoin_prices_{date_str}.csv")
+def load_latest_price(date_str: str, asset: str) -> pd.DataFrame | None:
+    patt_new = str(PRICE_DIR / f"{asset}_prices_{date_str}.csv")
     patt_legacy = str(DATA_DIR / f"bitcoin_data_{date_str}.csv")
-    cand = glob.glob(patt_new) or glob.glob(patt_legacy)
+    cand = glob.glob(patt_new) or (glob.glob(patt_legacy) if asset == "bitcoin" else [])
     if not cand:
         return None
     df = pd.read_csv(cand[0])
@@ -69,30 +82,35 @@ def load_latest_price(date_str: str) -> pd.DataFrame | None:
     return df.sort_values("datetime")
 
 def make_series(df: pd.DataFrame, value_col: str, rule: str) -> pd.DataFrame:
-    ts = (
-        df.set_index("datetime")[[value_col]]
-          .resample(rule).mean()
-          .dropna()
-          .reset_index()
-    )
-    ts.rename(columns={value_col: value_col}, inplace=True)
-    return ts
+    return resample_mean(df, value_col, rule)
+
+def load_series(root: Path, kind: str | None, value_col: str, rule: str, load_raw) -> pd.DataFrame | None:
+    ts = rollups.load_mean(root, kind, rule, date_str, value_col) if kind else None
+    if ts is not None:
+        return ts
+    df = load_raw()
+    return make_series(df, value_col, rule) if df is not None else None
 
 sent_df = load_latest_sentiment(date_str)
-price_df = load_latest_price(date_str)
+sent_kind = "weighted_sentiment" if asset == DEFAULT_ASSET else None
+if sent_df is not None and "assets" in sent_df.columns:
+    sent_df = _assets.split_by_asset(sent_df, DEFAULT_ASSET).get(asset)
+    sent_kind = f"{asset}_weighted_sentiment"
+elif asset != DEFAULT_ASSET:
+    sent_df = None
 
 left, right = st.columns([2,1])
 
 with left:
-    if price_df is not None:
-        price_ts = make_series(price_df, "price", resample)
-        fig_price = px.line(price_ts, x="datetime", y="price", title="BTC Price")
+    price_ts = load_series(PRICE_DIR, f"{asset}_price", "price", resample, lambda: load_latest_price(date_str, asset))
+    if price_ts is not None:
+        fig_price = px.line(price_ts, x="datetime", y="price", title=f"{asset.capitalize()} Price")
         st.plotly_chart(fig_price, use_container_width=True)
     else:
         st.info("No price data for selected date.")
 
     if sent_df is not None:
-        sent_ts = make_series(sent_df, "weighted_sentiment", resample)
+        sent_ts = load_series(SENT_DIR, sent_kind, "weighted_sentiment", resample, lambda: sent_df)
         sent_ts["rolling"] = sent_ts["weighted_sentiment"].rolling(max(1, lookback // 5)).mean()
         fig_sent = px.line(sent_ts, x="datetime", y=["weighted_sentiment","rolling"], title="Weighted Sentiment")
         st.plotly_chart(fig_sent, use_container_width=True)
@@ -139,3 +157,24 @@ if sent_df is not None:
     st.dataframe(sent_df[display_cols].sort_values("time", ascending=False).head(50), use_container_width=True, height=420)
 else:
     st.write("—")
+
+st.divider()
+st.subheader("Search Headlines")
+index_file = storage.index_path(DATA_DIR)
+if index_file.exists():
+    s1, s2, s3 = st.columns([2,1,1])
+    with s1:
+        query = st.text_input("Search", "")
+    with s2:
+        span = st.date_input("Date range", (datetime.now() - timedelta(days=30), datetime.now()))
+    with s3:
+        sent_label = st.selectbox("Sentiment", ["All","Positive","Neutral","Negative"])
+    span = span if isinstance(span, (list, tuple)) else (span,)
+    start = span[0].strftime("%Y-%m-%d") if span else None
+    end = span[-1].strftime("%Y-%m-%d") if span else None
+    sentiment = {"Positive": 1, "Neutral": 0, "Negative": -1}.get(sent_label)
+    with closing(search_index.connect(index_file)) as conn:
+        hits = search_index.search(conn, query, start, end, sentiment, limit=200)
+    st.dataframe(hits, use_container_width=True, height=420)
+else:
+    st.write("—")
@@ -1,11 +1,18 @@
 from pathlib import Path
+from contextlib import closing
 from datetime import datetime
-import yaml, pandas as pd
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import sys, yaml, pandas as pd
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.features import rollups
+from src.io import storage, search_index
+from src.processing import assets as _assets
+from src.sentiment import recombine
+from src.sentiment.components import analyze_row
+
 CFG = ROOT / "config" / "model.yaml"
+DATA_CFG = ROOT / "config" / "data.yaml"
 DATA = ROOT / "data"
 NEWS = DATA / "news"
 SENT = DATA / "sentiment"
@@ -13,32 +20,13 @@ SENT.mkdir(parents=True, exist_ok=True)
 
 with open(CFG) as f:
     model_cfg = yaml.safe_load(f)
+with open(DATA_CFG) as f:
+    ASSETS = _assets.from_config(yaml.safe_load(f))
 
 DATE = datetime.now().strftime("%Y-%m-%d")
 NEWS_FILE = NEWS / f"crypto_news_{DATE}.csv"
 OUT = SENT / f"sentiment_analysis_{DATE}.csv"
 
-vader = SentimentIntensityAnalyzer()
-lex_pos = ["surge","soar","record","breakthrough","bullish","rally"]
-lex_neg = ["crash","plunge","hack","lawsuit","fraud","bearish"]
-
-def lex_score(text: str) -> float:
-    t = text.lower()
-    p = sum(t.count(w) for w in lex_pos)
-    n = sum(t.count(w) for w in lex_neg)
-    return p*0.5 - n*0.8
-
-def analyze_row(headline, summary):
-    full = f"{headline} {summary}"
-    v = vader.polarity_scores(full)["compound"]
-    tb = TextBlob(full).sentiment.polarity
-    lx = lex_score(full)
-    w = model_cfg["weights"]
-    score = v*w["vader"] + tb*w["textblob"] + lx*w["lexicon"]
-    conf = min(abs(score), 1.0)
-    sent = 1 if score > model_cfg["thresholds"]["sentiment"] else (-1 if score < -model_cfg["thresholds"]["sentiment"] else 0)
-    return sent, conf, score
-
 def main():
     if not NEWS_FILE.exists():
         print("no news file for today")
@@ -46,16 +34,18 @@ def main():
     df = pd.read_csv(NEWS_FILE)
     res = []
     for _, r in df.iterrows():
-        s, c, raw = analyze_row(r.get("headline",""), r.get("summary",""))
         res.append({
             "time": r["time"],
             "headline": r["headline"],
-            "sentiment": s,
-            "confidence": c,
-            "score": raw
+            **analyze_row(r.get("headline",""), r.get("summary","")),
         })
-    out = pd.DataFrame(res).sort_values("time", ascending=False)
+    out = recombine.recombine(pd.DataFrame(res), model_cfg["weights"], model_cfg["thresholds"]["sentiment"])
+    out["assets"] = _assets.tag_assets(df["headline"].fillna("") + " " + df["summary"].fillna(""), ASSETS).values
+    out = out.sort_values("time", ascending=False)
     out.to_csv(OUT, index=False)
+    rollups.update_sentiment(SENT, DATE, out)
+    with closing(search_index.connect(storage.index_path(ROOT / "data"))) as conn:
+        search_index.set_sentiment(conn, DATE, out.to_dict("records"))
     print(f"saved {len(out)} rows -> {OUT}")
 
 if __name__ == "__main__":
@@ -1,15 +1,25 @@
 from pathlib import Path
-import sys, pandas as pd
+from contextlib import closing
+import sys, yaml, pandas as pd
 from datetime import datetime
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.features import rollups
+from src.io import storage, search_index
+from src.processing import assets as _assets
+from src.sentiment import recombine
+from src.sentiment.components import analyze_row
+
 NEWS = ROOT / "data" / "news"
 SENT = ROOT / "data" / "sentiment"
+CFG = ROOT / "config" / "model.yaml"
+DATA_CFG = ROOT / "config" / "data.yaml"
+
+with open(CFG) as f:
+    model_cfg = yaml.safe_load(f)
 
 def analyze_file(date_str: str):
-    from textblob import TextBlob
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-    vader = SentimentIntensityAnalyzer()
     f = NEWS / f"crypto_news_{date_str}.csv"
     if not f.exists():
         print("missing news file")
@@ -17,20 +27,22 @@ def analyze_file(date_str: str):
     df = pd.read_csv(f)
     rows = []
     for _, r in df.iterrows():
-        full = f"{r.get('headline','')} {r.get('summary','')}"
-        v = vader.polarity_scores(full)["compound"]
-        tb = TextBlob(full).sentiment.polarity
-        score = 0.6*v + 0.4*tb
         rows.append({
             "time": r["time"],
             "headline": r["headline"],
-            "sentiment": 1 if score > 0.03 else (-1 if score < -0.03 else 0),
-            "confidence": min(abs(score), 1.0),
-            "score": score
+            **analyze_row(r.get("headline",""), r.get("summary","")),
         })
-    out = pd.DataFrame(rows).sort_values("time", ascending=False)
+    with open(DATA_CFG) as fh:
+        assets = _assets.from_config(yaml.safe_load(fh))
+    out = recombine.recombine(pd.DataFrame(rows), model_cfg["weights"], model_cfg["thresholds"]["sentiment"])
+    out["assets"] = _assets.tag_assets(df["headline"].fillna("") + " " + df["summary"].fillna(""), assets).values
+    out = out.sort_values("time", ascending=False)
     SENT.mkdir(parents=True, exist_ok=True)
     out.to_csv(SENT / f"sentiment_analysis_{date_str}.csv", index=False)
+    rollups.update_sentiment(SENT, date_str, out)
+    with closing(search_index.connect(storage.index_path(ROOT / "data"))) as conn:
+        search_index.add_news(conn, df.to_dict("records"))
+        search_index.set_sentiment(conn, date_str, out.to_dict("records"))
     print(f"backfilled -> sentiment_analysis_{date_str}.csv")
 
 if __name__ == "__main__":
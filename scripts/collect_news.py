@@ -1,8 +1,13 @@
 from pathlib import Path
 from datetime import datetime
-import time, csv, glob, yaml, feedparser, pandas as pd
+from contextlib import closing
+import sys, time, csv, glob, yaml, pandas as pd
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.io import storage, search_index
+from src.collectors import news_rss, feed_state
+
 CFG = ROOT / "config" / "data.yaml"
 DATA = ROOT / "data" / "news"
 DATA.mkdir(parents=True, exist_ok=True)
@@ -15,30 +20,8 @@ cfg = yml(CFG)
 TZ = datetime.now().astimezone().tzinfo
 DATE = datetime.now(TZ).strftime("%Y-%m-%d")
 OUT = DATA / f"crypto_news_{DATE}.csv"
-
-def parse_date(s):
-    try:
-        return datetime.strptime(s, "%a, %d %b %Y %H:%M:%S %z").astimezone(TZ)
-    except:
-        try:
-            return datetime.strptime(s, "%Y-%m-%dT%H:%M:%S%z").astimezone(TZ)
-        except:
-            return datetime.now(TZ)
-
-def fetch_source(name, url):
-    feed = feedparser.parse(url)
-    rows = []
-    for e in feed.entries:
-        dt = parse_date(e.get("published", ""))
-        rows.append({
-            "date": dt.strftime("%Y-%m-%d"),
-            "time": dt.strftime("%H:%M:%S"),
-            "headline": e.get("title", "").strip(),
-            "source": name,
-            "link": e.get("link", ""),
-            "summary": (e.get("summary","") or "").strip()[:240]
-        })
-    return rows
+STATE = storage.feed_state_path(ROOT / "data")
+POLL = feed_state.PollCfg(**cfg.get("polling", {}))
 
 def load_existing(path):
     if not path.exists():
@@ -64,13 +47,23 @@ def write_csv(path, rows):
 
 def main():
     seen = load_existing(OUT)
+    states = feed_state.load(STATE)
     new_rows = []
     for name, url in cfg["sources"].items():
-        new_rows += [r for r in fetch_source(name, url) if r["date"] == DATE and r["headline"] not in seen]
+        st = states.setdefault(name, feed_state.SourceState())
+        if not feed_state.due(st, time.time()):
+            continue
+        rows = news_rss.fetch_feed(name, url, st)
+        feed_state.record_poll(st, time.time(), len(rows), POLL)
+        new_rows += [r for r in rows if r["date"] == DATE and r["headline"] not in seen]
         time.sleep(0.5)
     if new_rows:
         write_csv(OUT, new_rows)
+        with closing(search_index.connect(storage.index_path(ROOT / "data"))) as conn:
+            search_index.add_news(conn, new_rows)
+    feed_state.save(STATE, states)
     print(f"wrote {len(new_rows)} new rows -> {OUT}")
+    return len(new_rows)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,26 @@
+from pathlib import Path
+from datetime import datetime
+import sys, yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.collectors import btc_price
+from src.processing import assets as _assets
+
+CFG = ROOT / "config" / "data.yaml"
+DATA = ROOT / "data" / "prices"
+
+with open(CFG) as f:
+    cfg = yaml.safe_load(f)
+
+ASSETS = _assets.from_config(cfg)
+
+def main():
+    ts = datetime.now(btc_price.TZ)
+    points = btc_price.get_price_points(ts, {a.name: a.coinlore_id for a in ASSETS})
+    for name, p in points.items():
+        btc_price.append_csv(DATA, ts, p["price"], name)
+    print(f"wrote {len(points)}/{len(ASSETS)} prices -> {DATA}")
+
+if __name__ == "__main__":
+    main()
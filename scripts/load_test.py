@@ -0,0 +1,174 @@
+from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import argparse, contextlib, importlib.util, io, json, multiprocessing, random, resource, sys, tempfile, time, types
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.collectors import btc_price, feed_state
+from src.io import storage
+
+WORDS = ["surge", "rally", "record high", "adoption", "steady", "hold", "drop", "risk", "hack", "crash", "lawsuit", "upgrade"]
+COINS = ["Bitcoin", "BTC", "Ethereum", "Solana", "XRP", "crypto market"]
+
+def _entry(feed: int, k: int, published: float) -> str:
+    rnd = random.Random(feed * 1_000_003 + k)
+    title = f"{rnd.choice(COINS)} {rnd.choice(WORDS)} as feed {feed} story {k} lands"
+    summary = f"Traders eye {rnd.choice(WORDS)} and {rnd.choice(WORDS)} after {rnd.choice(COINS)} moves."
+    pub = format_datetime(datetime.fromtimestamp(published, timezone.utc))
+    return (f"<item><title>{title}</title><link>http://feeds.local/{feed}/{k}</link>"
+            f"<guid>{feed}-{k}</guid><pubDate>{pub}</pubDate><description>{summary}</description></item>")
+
+def _handler(opts: dict, t0: float):
+    per_sec = opts["rate"] / 60.0
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, body: bytes = b"", ctype: str = "application/rss+xml", headers: dict | None = None):
+            self.send_response(code)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = url.path.strip("/").split("/")
+            if parts[:2] == ["api", "ticker"]:
+                ids = parse_qs(url.query).get("id", [""])[0].split(",")
+                step = int(time.time() - t0)
+                rows = [{"id": i, "price_usd": str(round(100 + int(i) % 997 + random.Random(f"{i}-{step}").uniform(-1, 1), 2))} for i in ids if i]
+                return self._send(200, json.dumps(rows).encode(), "application/json")
+            if len(parts) != 2 or parts[0] != "feed":
+                return self._send(404)
+            feed = int(parts[1])
+            if feed < opts["broken"]:
+                if feed % 2 == 0:
+                    return self._send(500)
+                return self._send(200, b"<rss><channel><item><title>truncated")
+            if feed < opts["broken"] + opts["slow"]:
+                time.sleep(opts["slow_delay"])
+            latest = opts["entries"] + int((time.time() - t0) * per_sec)
+            etag = f'"{feed}-{latest}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, headers={"ETag": etag})
+            items = "".join(
+                _entry(feed, k, t0 + (k - opts["entries"]) / max(per_sec, 1e-9))
+                for k in range(latest - 1, max(latest - opts["entries"], 0) - 1, -1)
+            )
+            body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>feed {feed}</title>{items}</channel></rss>'
+            return self._send(200, body.encode(), headers={"ETag": etag})
+
+    return Handler
+
+def _serve(opts: dict, port_q):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(opts, time.time()))
+    port_q.put(server.server_address[1])
+    server.serve_forever()
+
+def _load_script(name: str) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location(f"_load_{name}", ROOT / "scripts" / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+def _pct(xs: list[float], q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(round(q * (len(xs) - 1))))] if xs else 0.0
+
+def _peak_rss_mb() -> float:
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return kb / 1024.0 if sys.platform != "darwin" else kb / 1024.0 / 1024.0
+
+def run(opts: dict) -> dict:
+    port_q = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(opts, port_q), daemon=True)
+    server.start()
+    base = f"http://127.0.0.1:{port_q.get(timeout=10)}"
+    tmp = Path(tempfile.mkdtemp(prefix="btc_load_"))
+    data = tmp / "data"
+
+    collect = _load_script("collect_news")
+    analyze = _load_script("analyze_sentiment")
+    forecast = _load_script("forecast_direction")
+    prices = _load_script("collect_prices")
+
+    collect.cfg = {**collect.cfg, "sources": {f"feed{i}": f"{base}/feed/{i}" for i in range(opts["feeds"])}}
+    collect.ROOT, collect.DATA = tmp, data / "news"
+    collect.OUT = storage.news_path(data, collect.DATE)
+    collect.STATE = storage.feed_state_path(data)
+    collect.time = types.SimpleNamespace(time=time.time, sleep=lambda _s: time.sleep(opts["pause"]))
+    collect.DATA.mkdir(parents=True, exist_ok=True)
+    if not opts["adaptive"]:
+        collect.POLL = feed_state.PollCfg(min_minutes=0, max_minutes=0)
+    analyze.ROOT, analyze.SENT = tmp, data / "sentiment"
+    analyze.NEWS_FILE = storage.news_path(data, analyze.DATE)
+    analyze.OUT = storage.sentiment_path(data, analyze.DATE)
+    analyze.SENT.mkdir(parents=True, exist_ok=True)
+    forecast.DATE = analyze.DATE
+    forecast.FILE = analyze.OUT
+    prices.DATA = data / "prices"
+    btc_price.API_URL = f"{base}/api/ticker/"
+
+    stages = {"collect": [], "analyze": [], "forecast": [], "prices": []}
+    cycles, collected = [], 0
+    try:
+        for c in range(opts["cycles"]):
+            start = time.perf_counter()
+            for name, mod in (("collect", collect), ("prices", prices), ("analyze", analyze), ("forecast", forecast)):
+                t = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    n = mod.main()
+                stages[name].append(time.perf_counter() - t)
+                if name == "collect":
+                    collected += n
+            cycles.append(time.perf_counter() - start)
+            print(f"cycle {c + 1}/{opts['cycles']}: {cycles[-1]:.2f}s, {collected} headlines", file=sys.stderr)
+            if c + 1 < opts["cycles"]:
+                time.sleep(max(0.0, opts["interval"] - cycles[-1]))
+    finally:
+        server.terminate()
+
+    busy = sum(cycles)
+    return {
+        "feeds": opts["feeds"],
+        "cycles": len(cycles),
+        "headlines": collected,
+        "headlines_per_sec": collected / busy if busy else 0.0,
+        "cycle_p50": _pct(cycles, 0.5),
+        "cycle_p90": _pct(cycles, 0.9),
+        "cycle_p99": _pct(cycles, 0.99),
+        **{f"{k}_p50": _pct(v, 0.5) for k, v in stages.items()},
+        **{f"{k}_p99": _pct(v, 0.99) for k, v in stages.items()},
+        "peak_rss_mb": _peak_rss_mb(),
+        "data_dir": str(data),
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description="Drive collect/analyze/forecast against local stand-in feeds and price API.")
+    ap.add_argument("--feeds", type=int, default=20)
+    ap.add_argument("--entries", type=int, default=30, help="entries per feed document")
+    ap.add_argument("--rate", type=float, default=2.0, help="new entries per feed per minute")
+    ap.add_argument("--slow", type=int, default=2, help="number of feeds that respond slowly")
+    ap.add_argument("--slow-delay", type=float, default=2.0)
+    ap.add_argument("--broken", type=int, default=2, help="number of feeds returning 500 or malformed XML")
+    ap.add_argument("--cycles", type=int, default=5)
+    ap.add_argument("--interval", type=float, default=10.0, help="seconds between cycle starts")
+    ap.add_argument("--pause", type=float, default=0.5, help="sleep between sources, as in collect_news.py")
+    ap.add_argument("--adaptive", action="store_true", help="keep the configured adaptive polling intervals")
+    ap.add_argument("--json", type=Path, default=None)
+    args = ap.parse_args()
+    report = run({k.replace("-", "_"): v for k, v in vars(args).items() if k != "json"})
+    for k, v in report.items():
+        print(f"{k}: {v:.3f}" if isinstance(v, float) else f"{k}: {v}")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.io import storage, schema
+
+DATA = ROOT / "data"
+
+def main(start: str, end: str):
+    dates = storage.date_range(start, end)
+    for kind in ("news", "sentiment"):
+        df = storage.read_days(DATA, kind, dates)
+        if df is None:
+            print(f"{kind}: no files")
+            continue
+        usage = schema.memory_usage(df)
+        cols = ", ".join(f"{c}={v / 1e6:.1f}MB" for c, v in usage.items() if c != "total")
+        print(f"{kind}: {len(df)} rows, {usage['total'] / 1e6:.1f}MB ({cols})")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: memory_report.py START [END]")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else sys.argv[1])
@@ -0,0 +1,32 @@
+from pathlib import Path
+import sys, yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.collectors import btc_price
+from src.features import rollups
+from src.io import storage
+from src.processing import assets as _assets
+
+DATA = ROOT / "data"
+CFG = ROOT / "config" / "data.yaml"
+
+with open(CFG) as f:
+    ASSETS = _assets.from_config(yaml.safe_load(f))
+
+def main(start: str, end: str):
+    n = 0
+    for d in storage.date_range(start, end):
+        for a in ASSETS:
+            n += bool(btc_price.rebuild_rollups(DATA / "prices", d, a.name))
+        df = storage.read_csv(storage.sentiment_path(DATA, d))
+        if df is not None:
+            rollups.update_sentiment(DATA / "sentiment", d, df)
+            n += 1
+    print(f"rebuilt rollups for {n} day files")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: rebuild_rollups.py START [END]")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else sys.argv[1])
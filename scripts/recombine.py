@@ -0,0 +1,53 @@
+from pathlib import Path
+from contextlib import closing
+import argparse, sys, time, yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from src.features import rollups
+from src.io import storage, search_index
+from src.sentiment import recombine
+
+CFG = ROOT / "config" / "model.yaml"
+DATA = ROOT / "data"
+
+with open(CFG) as f:
+    model_cfg = yaml.safe_load(f)
+
+def parse_weights(s: str | None) -> dict:
+    w = dict(model_cfg["weights"])
+    for item in (s or "").split(","):
+        if item.strip():
+            k, v = item.split("=")
+            w[k.strip()] = float(v)
+    return w
+
+def main(start: str, end: str, weights: dict, threshold: float):
+    t0 = time.perf_counter()
+    n_rows, skipped = 0, []
+    with closing(search_index.connect(storage.index_path(DATA))) as conn:
+        for d in storage.date_range(start, end):
+            path = storage.sentiment_path(DATA, d)
+            df = storage.read_csv(path)
+            if df is None:
+                continue
+            if not recombine.has_components(df):
+                skipped.append(d)
+                continue
+            out = recombine.recombine(df, weights, threshold)
+            storage.write_csv(out, path)
+            rollups.update_sentiment(path.parent, d, out)
+            search_index.set_sentiment(conn, d, out.to_dict("records"))
+            n_rows += len(out)
+    print(f"recombined {n_rows} rows in {time.perf_counter() - t0:.2f}s")
+    if skipped:
+        print(f"no component scores (rerun backfill): {', '.join(skipped)}")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Recompute score/sentiment/confidence from stored component scores.")
+    ap.add_argument("start")
+    ap.add_argument("end", nargs="?")
+    ap.add_argument("--weights", help="overrides, e.g. vader=0.4,transformer=0.3")
+    ap.add_argument("--threshold", type=float, default=model_cfg["thresholds"]["sentiment"])
+    args = ap.parse_args()
+    main(args.start, args.end or args.start, parse_weights(args.weights), args.threshold)
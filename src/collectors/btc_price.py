@@ -2,18 +2,27 @@ from datetime import datetime
 from pathlib import Path
 import csv, requests, pandas as pd
 
+from ..features import rollups
+
 TZ = datetime.now().astimezone().tzinfo
+API_URL = "https://api.coinlore.net/api/ticker/"
 
-def get_price_point(ts: datetime) -> dict | None:
-    r = requests.get("https://api.coinlore.net/api/ticker/?id=90", timeout=10)
+def get_price_points(ts: datetime, ids: dict[str, int], api_url: str | None = None) -> dict[str, dict]:
+    r = requests.get(api_url or API_URL, params={"id": ",".join(str(i) for i in ids.values())}, timeout=10)
     if r.status_code != 200:
-        return None
-    data = r.json()[0]
-    return {"timestamp": ts, "price": float(data["price_usd"])}
+        return {}
+    by_id = {str(d["id"]): d for d in r.json()}
+    return {
+        name: {"timestamp": ts, "price": float(by_id[str(i)]["price_usd"])}
+        for name, i in ids.items() if str(i) in by_id
+    }
 
-def append_csv(root: Path, ts: datetime, price: float) -> Path:
+def get_price_point(ts: datetime, coin_id: int = 90) -> dict | None:
+    return get_price_points(ts, {"coin": coin_id}).get("coin")
+
+def append_csv(root: Path, ts: datetime, price: float, asset: str = "bitcoin") -> Path:
     root.mkdir(parents=True, exist_ok=True)
-    fn = root / f"bitcoin_prices_{ts.strftime('%Y-%m-%d')}.csv"
+    fn = root / f"{asset}_prices_{ts.strftime('%Y-%m-%d')}.csv"
     header = ["date","time","price"]
     mode = "a" if fn.exists() else "w"
     with open(fn, mode, newline="") as f:
@@ -21,10 +30,22 @@ def append_csv(root: Path, ts: datetime, price: float) -> Path:
         if mode == "w":
             w.writerow(header)
         w.writerow([ts.strftime("%Y-%m-%d"), ts.strftime("%H:%M:%S"), price])
+    day = ts.strftime("%Y-%m-%d")
+    if mode == "a" and not rollups.exists(root, f"{asset}_price", day):
+        rebuild_rollups(root, day, asset)
+    else:
+        point = pd.DataFrame({"datetime": [pd.Timestamp(ts.strftime("%Y-%m-%d %H:%M:%S"))], "price": [price]})
+        rollups.update(root, f"{asset}_price", day, point, "price")
     return fn
 
-def load_day(root: Path, day: str) -> pd.DataFrame | None:
-    fn = root / f"bitcoin_prices_{day}.csv"
+def rebuild_rollups(root: Path, day: str, asset: str = "bitcoin") -> dict[str, Path]:
+    df = load_day(root, day, asset)
+    if df is None:
+        return {}
+    return rollups.update(root, f"{asset}_price", day, df, "price", incremental=False)
+
+def load_day(root: Path, day: str, asset: str = "bitcoin") -> pd.DataFrame | None:
+    fn = root / f"{asset}_prices_{day}.csv"
     if not fn.exists():
         return None
     df = pd.read_csv(fn)
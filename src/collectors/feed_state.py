@@ -0,0 +1,53 @@
+from dataclasses import dataclass, asdict, field, fields
+from pathlib import Path
+import json
+
+@dataclass
+class SourceState:
+    etag: str | None = None
+    modified: str | None = None
+    seen_ids: list[str] = field(default_factory=list)
+    rate_per_hour: float = 0.0
+    interval_minutes: float = 0.0
+    last_poll: float = 0.0
+    next_poll: float = 0.0
+
+SEEN_MAX = 500
+
+@dataclass
+class PollCfg:
+    min_minutes: float = 5.0
+    max_minutes: float = 120.0
+    target_entries: float = 1.0
+    alpha: float = 0.3
+
+def load(path: Path) -> dict[str, SourceState]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        raw = json.load(f)
+    names = {f.name for f in fields(SourceState)}
+    return {k: SourceState(**{a: b for a, b in v.items() if a in names}) for k, v in raw.items()}
+
+def save(path: Path, states: dict[str, SourceState]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({k: asdict(v) for k, v in states.items()}, f, indent=2)
+    tmp.replace(path)
+    return path
+
+def due(state: SourceState, now: float, slack_seconds: float = 30.0) -> bool:
+    return now + slack_seconds >= state.next_poll
+
+def record_poll(state: SourceState, now: float, n_new: int, cfg: PollCfg) -> SourceState:
+    if state.last_poll > 0 and now > state.last_poll:
+        observed = n_new / ((now - state.last_poll) / 3600.0)
+        state.rate_per_hour = cfg.alpha * observed + (1 - cfg.alpha) * state.rate_per_hour
+        interval = cfg.target_entries / state.rate_per_hour * 60.0 if state.rate_per_hour > 0 else cfg.max_minutes
+    else:
+        interval = cfg.min_minutes
+    state.interval_minutes = min(max(interval, cfg.min_minutes), cfg.max_minutes)
+    state.last_poll = now
+    state.next_poll = now + state.interval_minutes * 60.0
+    return state
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import List, Dict
 import feedparser
 
+from .feed_state import SourceState, SEEN_MAX
+
 TZ = datetime.now().astimezone().tzinfo
 
 def _parse_date(s: str) -> datetime:
@@ -12,10 +14,23 @@ def _parse_date(s: str) -> datetime:
             continue
     return datetime.now(TZ)
 
-def fetch_feed(name: str, url: str) -> List[Dict]:
-    feed = feedparser.parse(url)
+def _entry_id(e) -> str:
+    return e.get("id") or e.get("link") or e.get("title", "")
+
+def fetch_feed(name: str, url: str, state: SourceState | None = None) -> List[Dict]:
+    if state is None:
+        feed = feedparser.parse(url)
+    else:
+        feed = feedparser.parse(url, etag=state.etag, modified=state.modified)
+        if getattr(feed, "status", None) == 304:
+            return []
+        state.etag = getattr(feed, "etag", None) or state.etag
+        state.modified = getattr(feed, "modified", None) or state.modified
+    seen = set(state.seen_ids) if state is not None else set()
     rows = []
     for e in feed.entries:
+        if _entry_id(e) in seen:
+            continue
         dt = _parse_date(e.get("published", ""))
         rows.append({
             "date": dt.strftime("%Y-%m-%d"),
@@ -25,4 +40,8 @@ def fetch_feed(name: str, url: str) -> List[Dict]:
             "link": e.get("link", ""),
             "summary": (e.get("summary","") or "").strip()[:240],
         })
+    if state is not None and feed.entries:
+        ids = [_entry_id(e) for e in feed.entries]
+        current = set(ids)
+        state.seen_ids = (ids + [i for i in state.seen_ids if i not in current])[:max(SEEN_MAX, len(ids))]
     return rows
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+WINDOWS = (15, 30, 60, 240)
+EWM_SPAN = 512.0
+
+def _ns(s: pd.Series) -> np.ndarray:
+    return pd.DatetimeIndex(s).as_unit("ns").asi8
+
+def _cum(x: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], np.cumsum(x, dtype=float)))
+
+def _tz(s: pd.Series):
+    return getattr(s.dtype, "tz", None)
+
+def _ewm(t: np.ndarray, v: np.ndarray, windows) -> np.ndarray:
+    hl = np.asarray(windows, dtype=float) * 60_000_000_000
+    ok = ~np.isnan(v)
+    x, c = np.where(ok, v, 0.0)[:, None], ok.astype(float)[:, None]
+    blocks = np.flatnonzero(np.diff((t - t[0]) // int(EWM_SPAN * hl.min()))) + 1
+    out = np.empty((len(t), len(hl)))
+    num, den, t_prev = np.zeros(len(hl)), np.zeros(len(hl)), t[0]
+    for s, e in zip(np.r_[0, blocks], np.r_[blocks, len(t)]):
+        g = np.exp2((t[s:e, None] - t[s]) / hl)
+        carry = np.exp2(-(t[s] - t_prev) / hl)
+        cn = np.cumsum(x[s:e] * g, axis=0) + num * carry
+        cd = np.cumsum(c[s:e] * g, axis=0) + den * carry
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[s:e] = cn / cd
+        num, den, t_prev = cn[-1] / g[-1], cd[-1] / g[-1], t[e - 1]
+    return out
+
+def _price_features(t: np.ndarray, price: pd.DataFrame, price_col: str, windows, out: dict) -> None:
+    price = price.dropna(subset=[price_col])
+    if price.empty:
+        return
+    if not price["datetime"].is_monotonic_increasing:
+        price = price.sort_values("datetime")
+    tp = _ns(price["datetime"])
+    pv = price[price_col].to_numpy(float)
+    logret = np.concatenate(([0.0], np.diff(np.log(pv))))
+    cs_r, cs_r2 = _cum(logret), _cum(logret ** 2)
+
+    now = np.searchsorted(tp, t, side="right") - 1
+    now_c = np.clip(now, 0, None)
+    p_now = np.where(now >= 0, pv[now_c], np.nan)
+    out["price"] = p_now
+    for w in windows:
+        then = np.searchsorted(tp, t - w * 60_000_000_000, side="right") - 1
+        then_c = np.clip(then, 0, None)
+        m = now_c - then_c
+        s = cs_r[now_c + 1] - cs_r[then_c + 1]
+        s2 = cs_r2[now_c + 1] - cs_r2[then_c + 1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (s2 - s * s / m) / (m - 1)
+        out[f"return_{w}m"] = p_now / np.where(then >= 0, pv[then_c], np.nan) - 1.0
+        out[f"volatility_{w}m"] = np.where((now >= 0) & (m > 1), np.sqrt(np.clip(var, 0, None)), np.nan)
+
+def compute(df: pd.DataFrame, value_col: str, windows=WINDOWS, threshold: float = 0.03,
+            price: pd.DataFrame | None = None, price_col: str = "price") -> pd.DataFrame:
+    if df is None or df.empty:
+        return pd.DataFrame(columns=["datetime"])
+    if not df["datetime"].is_monotonic_increasing:
+        df = df.sort_values("datetime")
+    t = _ns(df["datetime"])
+    v = df[value_col].to_numpy(float)
+    cs_v, cs_n = _cum(np.nan_to_num(v)), _cum(~np.isnan(v))
+    cs_pos, cs_neg = _cum(v > threshold), _cum(v < -threshold)
+    right = np.searchsorted(t, t, side="right")
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = {"datetime": df["datetime"], "cum_mean": cs_v[right] / cs_n[right]}
+    for w in windows:
+        left = np.searchsorted(t, t - w * 60_000_000_000, side="left")
+        n = cs_n[right] - cs_n[left]
+        pos, neg = cs_pos[right] - cs_pos[left], cs_neg[right] - cs_neg[left]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = (cs_v[right] - cs_v[left]) / n
+        out[f"count_{w}m"] = n.astype(int)
+        out[f"mean_{w}m"] = mean
+        out[f"momentum_{w}m"] = mean - out["cum_mean"]
+        out[f"pos_neg_ratio_{w}m"] = np.divide(pos - neg, pos + neg, out=np.zeros(len(t)), where=pos + neg > 0)
+
+    for w, col in zip(windows, _ewm(t, v, windows).T):
+        out[f"ewm_{w}m"] = col
+
+    if price is not None and not price.empty:
+        if (_tz(df["datetime"]) is None) != (_tz(price["datetime"]) is None):
+            raise ValueError("sentiment and price datetimes must both be tz-aware or both naive; "
+                             "tz_localize the naive side before computing features")
+        _price_features(t, price, price_col, windows, out)
+    return pd.DataFrame(out, index=df.index)
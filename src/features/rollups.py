@@ -0,0 +1,83 @@
+from pathlib import Path
+import pandas as pd
+
+from ..io import storage
+from ..processing.assets import split_by_asset
+
+BASE_RULE = "1min"
+RULES = ["5min", "15min", "30min", "60min"]
+COLS = ["datetime", "sum", "count", "min", "max"]
+AGG = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+def bucketize(df: pd.DataFrame, value_col: str, rule: str = BASE_RULE) -> pd.DataFrame:
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLS)
+    s = df.dropna(subset=[value_col]).set_index("datetime")[value_col]
+    b = s.groupby(s.index.floor(rule)).agg(["sum", "count", "min", "max"])
+    b.index.name = "datetime"
+    return b.reset_index()
+
+def merge(*buckets: pd.DataFrame) -> pd.DataFrame:
+    parts = [b for b in buckets if b is not None and not b.empty]
+    if not parts:
+        return pd.DataFrame(columns=COLS)
+    return pd.concat(parts).groupby("datetime").agg(AGG).reset_index()
+
+def coarsen(buckets: pd.DataFrame, rule: str) -> pd.DataFrame:
+    if buckets.empty:
+        return pd.DataFrame(columns=COLS)
+    b = buckets.groupby(buckets["datetime"].dt.floor(rule)).agg(AGG)
+    return b.reset_index()
+
+def to_mean(buckets: pd.DataFrame, value_col: str) -> pd.DataFrame:
+    b = buckets[buckets["count"] > 0]
+    return pd.DataFrame({"datetime": b["datetime"], value_col: b["sum"] / b["count"]}).reset_index(drop=True)
+
+def exists(root: Path, kind: str, date_str: str) -> bool:
+    return storage.rollup_path(root, kind, BASE_RULE, date_str).exists()
+
+def load(root: Path, kind: str, rule: str, date_str: str) -> pd.DataFrame | None:
+    df = storage.read_csv(storage.rollup_path(root, kind, rule, date_str))
+    if df is None:
+        return None
+    df["datetime"] = pd.to_datetime(df["datetime"])
+    return df
+
+def update(root: Path, kind: str, date_str: str, df: pd.DataFrame, value_col: str, incremental: bool = True) -> dict[str, Path]:
+    base = bucketize(df, value_col)
+    if incremental:
+        base = merge(load(root, kind, BASE_RULE, date_str), base)
+    out = {BASE_RULE: storage.write_csv(base, storage.rollup_path(root, kind, BASE_RULE, date_str))}
+    for rule in RULES:
+        out[rule] = storage.write_csv(coarsen(base, rule), storage.rollup_path(root, kind, rule, date_str))
+    return out
+
+def remove(root: Path, kind: str, date_str: str) -> None:
+    for rule in [BASE_RULE, *RULES]:
+        storage.rollup_path(root, kind, rule, date_str).unlink(missing_ok=True)
+
+def load_mean(root: Path, kind: str, rule: str, date_str: str, value_col: str) -> pd.DataFrame | None:
+    b = load(root, kind, rule, date_str)
+    if b is None:
+        base = load(root, kind, BASE_RULE, date_str)
+        if base is None:
+            return None
+        b = coarsen(base, rule)
+    return to_mean(b, value_col)
+
+def update_sentiment(root: Path, date_str: str, df: pd.DataFrame) -> dict[str, Path]:
+    ts = pd.DataFrame({
+        "datetime": pd.to_datetime(date_str + " " + df["time"]),
+        "weighted_sentiment": df["sentiment"] * df["confidence"],
+    })
+    out = update(root, "weighted_sentiment", date_str, ts, "weighted_sentiment", incremental=False)
+    if "assets" in df.columns:
+        parts = split_by_asset(df)
+        for name, part in parts.items():
+            update(root, f"{name}_weighted_sentiment", date_str, ts.loc[part.index], "weighted_sentiment", incremental=False)
+        suffix = f"_weighted_sentiment_{BASE_RULE}_{date_str}.csv"
+        for fn in storage.rollup_path(root, "*", BASE_RULE, date_str).parent.glob(f"*{suffix}"):
+            name = fn.name[:-len(suffix)]
+            if name not in parts:
+                remove(root, f"{name}_weighted_sentiment", date_str)
+    return out
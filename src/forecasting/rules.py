@@ -11,27 +11,21 @@ class PredictCfg:
     lookback_minutes: int = 60
     min_articles: int = 3
 
-def classify(x: float, th: float) -> int:
-    return 1 if x > th else (-1 if x < -th else 0)
-
 def direction_and_confidence(df: pd.DataFrame, th: Thresholds, pcfg: PredictCfg) -> tuple[str, float, dict]:
     if df is None or df.empty or "datetime" not in df or "sentiment" not in df or "confidence" not in df:
         return "NEUTRAL", 0.5, {}
 
-    df = df.sort_values("datetime").copy()
-    df["weighted"] = df["sentiment"] * df["confidence"]
+    weighted = df["sentiment"] * df["confidence"]
 
     now = df["datetime"].max()
     cut = now - pd.Timedelta(minutes=pcfg.lookback_minutes)
-    recent = df[df["datetime"] >= cut]
-    daily = df
+    recent = weighted[df["datetime"] >= cut]
 
-    r_avg = recent["weighted"].mean() if not recent.empty else 0.0
-    d_avg = daily["weighted"].mean() if not daily.empty else 0.0
+    r_avg = float(recent.mean()) if not recent.empty else 0.0
+    d_avg = float(weighted.mean()) if not weighted.empty else 0.0
     momentum = r_avg - d_avg
 
-    cls = recent["weighted"].apply(lambda x: classify(x, th.sentiment)) if not recent.empty else pd.Series(dtype=int)
-    pos = int((cls == 1).sum()); neg = int((cls == -1).sum())
+    pos = int((recent > th.sentiment).sum()); neg = int((recent < -th.sentiment).sum())
     ratio = (pos - neg) / (pos + neg) if (pos + neg) > 0 else 0.0
 
     if len(recent) < pcfg.min_articles:
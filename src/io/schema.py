@@ -0,0 +1,60 @@
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    STRING = pd.StringDtype("pyarrow")
+except ImportError:
+    STRING = pd.StringDtype()
+
+NEWS = {
+    "date": STRING,
+    "time": STRING,
+    "headline": STRING,
+    "source": "category",
+    "link": STRING,
+    "summary": STRING,
+}
+
+SENTIMENT = {
+    "date": STRING,
+    "time": STRING,
+    "headline": STRING,
+    "sentiment": "int8",
+    "confidence": "float32",
+    "score": "float32",
+    "vader": "float32",
+    "textblob": "float32",
+    "transformer": "float32",
+    "lexicon": "float32",
+    "assets": STRING,
+}
+
+PRICE = {
+    "date": STRING,
+    "time": STRING,
+    "price": "float64",
+}
+
+SCHEMAS = {"news": NEWS, "sentiment": SENTIMENT, "price": PRICE}
+
+def _is_numeric(dtype) -> bool:
+    return isinstance(dtype, str) and (dtype.startswith("int") or dtype.startswith("float"))
+
+def read_dtypes(kind: str) -> dict:
+    return {c: t for c, t in SCHEMAS[kind].items() if not _is_numeric(t)}
+
+def apply(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    for col, dtype in SCHEMAS[kind].items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        s = df[col]
+        if _is_numeric(dtype):
+            s = pd.to_numeric(s, errors="coerce")
+            if dtype.startswith("int"):
+                s = s.fillna(0)
+        df[col] = s.astype(dtype)
+    return df
+
+def memory_usage(df: pd.DataFrame) -> dict[str, int]:
+    usage = df.memory_usage(index=True, deep=True)
+    return {**{str(k): int(v) for k, v in usage.items()}, "total": int(usage.sum())}
@@ -0,0 +1,88 @@
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Mapping
+import pandas as pd
+
+DDL = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    link TEXT NOT NULL DEFAULT '',
+    sentiment INTEGER,
+    confidence REAL,
+    UNIQUE (date, headline)
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (date, time);
+CREATE INDEX IF NOT EXISTS articles_sentiment ON articles (sentiment, date);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    headline, summary, content='articles', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, headline, summary) VALUES (new.id, new.headline, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, headline, summary) VALUES ('delete', old.id, old.headline, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF headline, summary ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, headline, summary) VALUES ('delete', old.id, old.headline, old.summary);
+    INSERT INTO articles_fts (rowid, headline, summary) VALUES (new.id, new.headline, new.summary);
+END;
+"""
+
+COLS = ["date", "time", "headline", "source", "link", "summary", "sentiment", "confidence"]
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(DDL)
+    return conn
+
+def _text(v) -> str:
+    return "" if v is None or v != v else str(v)
+
+def add_news(conn: sqlite3.Connection, rows: Iterable[Mapping]) -> int:
+    with conn:
+        cur = conn.executemany(
+            "INSERT OR IGNORE INTO articles (date, time, headline, summary, source, link) VALUES (?, ?, ?, ?, ?, ?)",
+            ((r["date"], r["time"], _text(r["headline"]), _text(r.get("summary")), _text(r.get("source")), _text(r.get("link"))) for r in rows),
+        )
+    return cur.rowcount
+
+def set_sentiment(conn: sqlite3.Connection, date_str: str, rows: Iterable[Mapping]) -> int:
+    with conn:
+        cur = conn.executemany(
+            "UPDATE articles SET sentiment = ?, confidence = ? WHERE date = ? AND headline = ?",
+            ((int(r["sentiment"]), float(r["confidence"]), date_str, r["headline"]) for r in rows),
+        )
+    return cur.rowcount
+
+def _match_expr(query: str) -> str:
+    return " ".join('"' + tok.replace('"', '""') + '"' for tok in query.split())
+
+def search(conn: sqlite3.Connection, query: str = "", start: str | None = None, end: str | None = None,
+           sentiment: int | None = None, limit: int = 50) -> pd.DataFrame:
+    where, params = [], []
+    sql = f"SELECT {', '.join('a.' + c for c in COLS)} FROM articles a"
+    if query.strip():
+        sql += " JOIN articles_fts f ON f.rowid = a.id"
+        where.append("articles_fts MATCH ?")
+        params.append(_match_expr(query))
+    if start:
+        where.append("a.date >= ?")
+        params.append(start)
+    if end:
+        where.append("a.date <= ?")
+        params.append(end)
+    if sentiment is not None:
+        where.append("a.sentiment = ?")
+        params.append(int(sentiment))
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY a.date DESC, a.time DESC LIMIT ?"
+    params.append(int(limit))
+    return pd.DataFrame(conn.execute(sql, params).fetchall(), columns=COLS)
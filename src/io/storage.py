@@ -1,6 +1,9 @@
 from pathlib import Path
+from typing import Iterable
 import pandas as pd
 
+from . import schema
+
 def ensure_dir(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     return p
@@ -11,13 +14,42 @@ def news_path(root: Path, date_str: str) -> Path:
 def sentiment_path(root: Path, date_str: str) -> Path:
     return root / "sentiment" / f"sentiment_analysis_{date_str}.csv"
 
-def price_path(root: Path, date_str: str) -> Path:
-    return root / "prices" / f"bitcoin_prices_{date_str}.csv"
+def price_path(root: Path, date_str: str, asset: str = "bitcoin") -> Path:
+    return root / "prices" / f"{asset}_prices_{date_str}.csv"
+
+def index_path(root: Path) -> Path:
+    return root / "index" / "news.sqlite"
+
+def feed_state_path(root: Path) -> Path:
+    return root / "state" / "feeds.json"
+
+def rollup_path(root: Path, kind: str, rule: str, date_str: str) -> Path:
+    return root / "rollups" / f"{kind}_{rule}_{date_str}.csv"
 
-def read_csv(path: Path) -> pd.DataFrame | None:
+PATHS = {"news": news_path, "sentiment": sentiment_path, "price": price_path}
+
+def read_csv(path: Path, kind: str | None = None) -> pd.DataFrame | None:
     if not path.exists():
         return None
-    return pd.read_csv(path)
+    if kind is None:
+        return pd.read_csv(path)
+    return schema.apply(pd.read_csv(path, dtype=schema.read_dtypes(kind)), kind)
+
+def date_range(start: str, end: str) -> list[str]:
+    return list(pd.date_range(start, end, freq="D").strftime("%Y-%m-%d"))
+
+def read_days(root: Path, kind: str, dates: Iterable[str]) -> pd.DataFrame | None:
+    frames = []
+    for d in dates:
+        df = read_csv(PATHS[kind](root, d), kind)
+        if df is None:
+            continue
+        if "date" not in df.columns:
+            df.insert(0, "date", pd.Series(d, index=df.index, dtype=schema.STRING))
+        frames.append(df)
+    if not frames:
+        return None
+    return schema.apply(pd.concat(frames, ignore_index=True), kind)
 
 def write_csv(df: pd.DataFrame, path: Path) -> Path:
     ensure_dir(path.parent)
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+import re
+import pandas as pd
+
+@dataclass
+class Asset:
+    name: str
+    coinlore_id: int
+    keywords: list[str] = field(default_factory=list)
+    default: bool = False
+
+BITCOIN = Asset("bitcoin", 90, ["bitcoin", "btc"], default=True)
+
+def from_config(cfg: dict) -> list[Asset]:
+    assets = cfg.get("assets") or {}
+    if not assets:
+        return [BITCOIN]
+    return [Asset(name, int(a["coinlore_id"]), [k.lower() for k in a.get("keywords", [name])], bool(a.get("default", False)))
+            for name, a in assets.items()]
+
+def default_name(assets: list[Asset]) -> str:
+    return next((a.name for a in assets if a.default), assets[0].name)
+
+def _matcher(assets: list[Asset]) -> tuple[re.Pattern, dict[str, str]]:
+    owner = {k: a.name for a in assets for k in a.keywords}
+    terms = sorted(owner, key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(re.escape(t) for t in terms) + r")\b"), owner
+
+def tag_assets(text: pd.Series, assets: list[Asset]) -> pd.Series:
+    pattern, owner = _matcher(assets)
+    order = {a.name: i for i, a in enumerate(assets)}
+    fallback = default_name(assets)
+    def _tags(hits: list[str]) -> str:
+        names = sorted({owner[h] for h in hits}, key=order.get)
+        return "|".join(names) if names else fallback
+    return text.fillna("").str.lower().str.findall(pattern).map(_tags)
+
+def split_by_asset(df: pd.DataFrame, default: str = BITCOIN.name) -> dict[str, pd.DataFrame]:
+    if "assets" not in df.columns:
+        return {default: df}
+    tags = df["assets"].astype(object).fillna("").str.split("|").explode()
+    tags = tags[tags != ""]
+    return {name: df.loc[ix] for name, ix in tags.groupby(tags).groups.items()}
@@ -0,0 +1,21 @@
+from typing import Dict
+from textblob import TextBlob
+from . import vader as _vader
+
+LEX_POS = ["surge","soar","record","breakthrough","bullish","rally"]
+LEX_NEG = ["crash","plunge","hack","lawsuit","fraud","bearish"]
+
+def lex_score(text: str) -> float:
+    t = text.lower()
+    p = sum(t.count(w) for w in LEX_POS)
+    n = sum(t.count(w) for w in LEX_NEG)
+    return p*0.5 - n*0.8
+
+def analyze_row(headline, summary) -> Dict[str, float]:
+    full = f"{headline} {summary}"
+    return {
+        "vader": _vader.score(full),
+        "textblob": TextBlob(full).sentiment.polarity,
+        "transformer": float("nan"),
+        "lexicon": lex_score(full),
+    }
@@ -0,0 +1,26 @@
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+COMPONENTS = ["vader", "textblob", "transformer", "lexicon"]
+DEFAULT_WEIGHTS = {"vader": 0.35, "textblob": 0.15, "transformer": 0.35, "lexicon": 0.15}
+OUTPUTS = ["sentiment", "confidence", "score"]
+
+def has_components(df: pd.DataFrame) -> bool:
+    return any(c in df.columns for c in COMPONENTS)
+
+def _columns(columns) -> list[str]:
+    cols = [c for c in columns if c not in OUTPUTS]
+    at = next((i for i, c in enumerate(cols) if c in COMPONENTS), len(cols))
+    return cols[:at] + OUTPUTS + cols[at:]
+
+def recombine(df: pd.DataFrame, weights: Dict[str, float], threshold: float) -> pd.DataFrame:
+    parts = np.nan_to_num(df.reindex(columns=COMPONENTS).to_numpy(dtype=float))
+    w = np.array([weights.get(c, DEFAULT_WEIGHTS[c]) for c in COMPONENTS], dtype=float)
+    score = parts @ w
+    out = df.assign(
+        sentiment=np.where(score > threshold, 1, np.where(score < -threshold, -1, 0)),
+        confidence=np.minimum(np.abs(score), 1.0),
+        score=score,
+    )
+    return out[_columns(out.columns)]
@@ -25,3 +25,82 @@ def test_btc_price_storage(tmp_path: Path):
     assert isinstance(df, pd.DataFrame)
     assert "datetime" in df.columns
     assert float(df.iloc[0]["price"]) == 45000.0
+
+def test_news_rss_conditional_get(monkeypatch):
+    from src.collectors.feed_state import SourceState
+    calls = []
+    entries = [{"id": "2", "title": "Newer", "published": ""}, {"id": "1", "title": "Older", "published": ""}]
+    def parse(_u, etag=None, modified=None):
+        calls.append((etag, modified))
+        if etag == "v1":
+            return types.SimpleNamespace(status=304, entries=[])
+        return types.SimpleNamespace(status=200, etag="v1", modified="m1", entries=entries)
+    monkeypatch.setattr(news_rss, "feedparser", types.SimpleNamespace(parse=parse))
+    st = SourceState(seen_ids=["1"])
+    rows = news_rss.fetch_feed("decrypt", "u", st)
+    assert [r["headline"] for r in rows] == ["Newer"]
+    assert st.etag == "v1" and st.seen_ids == ["2", "1"]
+    assert news_rss.fetch_feed("decrypt", "u", st) == []
+    assert calls[-1] == ("v1", "m1")
+
+def test_feed_state_adaptive_interval(tmp_path: Path):
+    from src.collectors import feed_state
+    cfg = feed_state.PollCfg(min_minutes=5, max_minutes=120, target_entries=1, alpha=1.0)
+    st = feed_state.record_poll(feed_state.SourceState(), 1000.0, 20, cfg)
+    assert st.interval_minutes == 5
+    st = feed_state.record_poll(st, 4600.0, 2, cfg)
+    assert st.interval_minutes == 30 and not feed_state.due(st, 4600.0 + 60)
+    st = feed_state.record_poll(st, 8200.0, 0, cfg)
+    assert st.interval_minutes == 120
+    path = feed_state.save(tmp_path / "feeds.json", {"decrypt": st})
+    assert feed_state.load(path)["decrypt"] == st
+
+def test_price_points_batched(monkeypatch, tmp_path: Path):
+    calls = []
+    def get(url, params=None, timeout=None):
+        calls.append(params)
+        return types.SimpleNamespace(status_code=200, json=lambda: [
+            {"id": "90", "price_usd": "45000.5"}, {"id": "80", "price_usd": "2400.25"},
+        ])
+    monkeypatch.setattr(btc_price, "requests", types.SimpleNamespace(get=get))
+    ts = datetime(2024,1,1,12,0,0)
+    points = btc_price.get_price_points(ts, {"bitcoin": 90, "ethereum": 80, "solana": 48543})
+    assert calls == [{"id": "90,80,48543"}]
+    assert points["ethereum"]["price"] == 2400.25 and "solana" not in points
+    for name, p in points.items():
+        btc_price.append_csv(tmp_path, ts, p["price"], name)
+    assert float(btc_price.load_day(tmp_path, "2024-01-01", "ethereum").iloc[0]["price"]) == 2400.25
+    assert (tmp_path / "bitcoin_prices_2024-01-01.csv").exists()
+
+def test_news_rss_oldest_first_feed(monkeypatch):
+    from src.collectors.feed_state import SourceState
+    entries = [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]
+    monkeypatch.setattr(news_rss, "feedparser", types.SimpleNamespace(parse=lambda _u, etag=None, modified=None: types.SimpleNamespace(status=200, entries=list(entries))))
+    st = SourceState()
+    assert [r["headline"] for r in news_rss.fetch_feed("x", "u", st)] == ["A", "B"]
+    entries.append({"id": "c", "title": "C"})
+    assert [r["headline"] for r in news_rss.fetch_feed("x", "u", st)] == ["C"]
+    assert news_rss.fetch_feed("x", "u", st) == []
+
+def test_price_rollup_seeded_from_existing_raw(tmp_path: Path):
+    from src.features import rollups
+    fn = tmp_path / "bitcoin_prices_2024-01-01.csv"
+    fn.write_text("date,time,price\n" + "".join(f"2024-01-01,{h:02d}:00:00,{100 + h}\n" for h in range(12)))
+    btc_price.append_csv(tmp_path, datetime(2024,1,1,12,30,0), 200.0)
+    hourly = rollups.load(tmp_path, "bitcoin_price", "60min", "2024-01-01")
+    assert len(hourly) == 13 and hourly["count"].sum() == 13
+    btc_price.append_csv(tmp_path, datetime(2024,1,1,12,45,0), 210.0)
+    assert rollups.load(tmp_path, "bitcoin_price", "60min", "2024-01-01")["count"].sum() == 14
+
+def test_load_test_smoke(monkeypatch):
+    import importlib.util, shutil
+    root = Path(__file__).resolve().parents[1]
+    spec = importlib.util.spec_from_file_location("_load_test_script", root / "scripts" / "load_test.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    monkeypatch.setattr(btc_price, "API_URL", btc_price.API_URL)
+    report = mod.run({"feeds": 2, "entries": 5, "rate": 60.0, "slow": 0, "slow_delay": 0.0, "broken": 0,
+                      "cycles": 1, "interval": 0.0, "pause": 0.0, "adaptive": False})
+    shutil.rmtree(Path(report["data_dir"]).parent)
+    assert {"feeds", "cycles", "headlines", "headlines_per_sec", "cycle_p50", "collect_p50", "forecast_p99", "peak_rss_mb"} <= set(report)
+    assert report["cycles"] == 1 and report["headlines"] > 0
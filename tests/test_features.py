@@ -21,3 +21,88 @@ def test_recent_and_ratio():
     s = pd.Series([0.1, 0.2, -0.5, 0.0, 0.3])
     ratio = pos_neg_ratio(s, 0.05)
     assert -1.0 <= ratio <= 1.0
+
+def test_rollups_match_resample(tmp_path):
+    from src.features import rollups
+    df = _series().rename(columns={"v":"value"})
+    first, second = df.iloc[:7], df.iloc[7:]
+    rollups.update(tmp_path, "value", "2024-01-01", first, "value")
+    rollups.update(tmp_path, "value", "2024-01-01", second, "value")
+    for rule in ["5min", "15min", "60min"]:
+        got = rollups.load_mean(tmp_path, "value", rule, "2024-01-01", "value")
+        exp = resample_mean(df, "value", rule)
+        assert got["value"].tolist() == exp["value"].tolist()
+        assert (got["datetime"] == exp["datetime"]).all()
+    b = rollups.load(tmp_path, "value", "60min", "2024-01-01")
+    assert b["count"].sum() == len(df) and b["max"].max() == 11
+
+def test_feature_engine_matches_window_helpers():
+    from src.features import engine
+    base = datetime(2024,1,1,12,0,0)
+    vals = [0.1, -0.2, 0.0, 0.4, -0.05, 0.3, 0.2, -0.6, 0.05, 0.1, 0.0, 0.25]
+    df = pd.DataFrame({"datetime": [base + timedelta(minutes=7*i) for i in range(12)], "w": vals})
+    price = pd.DataFrame({"datetime": [base + timedelta(minutes=5*i) for i in range(20)], "price": [100 + i for i in range(20)]})
+    feats = engine.compute(df.sample(frac=1, random_state=0), "w", windows=(15, 60), threshold=0.03, price=price)
+    assert list(feats["datetime"]) == list(df["datetime"])
+    for i in range(len(df)):
+        win = recent_window(df.iloc[:i+1], 60)
+        row = feats.iloc[i]
+        assert row["count_60m"] == len(win)
+        assert abs(row["mean_60m"] - win["w"].mean()) < 1e-12
+        assert abs(row["pos_neg_ratio_60m"] - pos_neg_ratio(win["w"], 0.03)) < 1e-12
+        assert abs(row["momentum_60m"] - (win["w"].mean() - df["w"].iloc[:i+1].mean())) < 1e-12
+    last = feats.iloc[-1]
+    t = df["datetime"].iloc[-1]
+    p_now = price[price["datetime"] <= t]["price"].iloc[-1]
+    p_then = price[price["datetime"] <= t - pd.Timedelta(minutes=60)]["price"].iloc[-1]
+    assert abs(last["return_60m"] - (p_now / p_then - 1)) < 1e-12
+    assert last["volatility_60m"] > 0 and "ewm_15m" in feats
+
+def test_sentiment_rollups_drop_assets_without_rows(tmp_path):
+    from src.features import rollups
+    df = pd.DataFrame({"time": ["12:00:00", "12:05:00"], "sentiment": [1, -1], "confidence": [0.5, 0.4],
+                       "assets": ["bitcoin|ethereum", "ethereum"]})
+    rollups.update_sentiment(tmp_path, "2024-01-01", df)
+    assert rollups.load_mean(tmp_path, "ethereum_weighted_sentiment", "15min", "2024-01-01", "v") is not None
+    rollups.update_sentiment(tmp_path, "2024-01-01", df.assign(assets="bitcoin"))
+    assert rollups.load_mean(tmp_path, "ethereum_weighted_sentiment", "15min", "2024-01-01", "v") is None
+    assert rollups.load_mean(tmp_path, "ethereum_weighted_sentiment", "1min", "2024-01-01", "v") is None
+    assert len(rollups.load_mean(tmp_path, "bitcoin_weighted_sentiment", "1min", "2024-01-01", "v")) == 2
+
+def test_feature_engine_skips_nan_values():
+    from src.features import engine
+    base = datetime(2024,1,1,12,0,0)
+    df = pd.DataFrame({"datetime": [base + timedelta(minutes=i) for i in range(5)], "w": [0.1, float("nan"), 0.2, 0.3, 0.4]})
+    feats = engine.compute(df, "w", windows=(15,))
+    assert feats["count_15m"].tolist() == [1, 1, 2, 3, 4]
+    for i in range(5):
+        exp = recent_window(df.iloc[:i+1], 15)["w"].mean()
+        assert abs(feats["mean_15m"].iloc[i] - exp) < 1e-12
+        assert abs(feats["cum_mean"].iloc[i] - exp) < 1e-12
+    assert feats["momentum_15m"].notna().all()
+
+def test_feature_engine_price_timezones():
+    import pytest
+    from src.features import engine
+    base = pd.Timestamp("2024-01-01 12:00:00")
+    sent = pd.DataFrame({"datetime": [base + pd.Timedelta(minutes=10*i) for i in range(4)], "w": [0.1, 0.2, -0.1, 0.3]})
+    price = pd.DataFrame({"datetime": [base + pd.Timedelta(minutes=10*i) for i in range(4)], "price": [100.0, 101.0, 102.0, 103.0]})
+    ny = sent.assign(datetime=sent["datetime"].dt.tz_localize("America/New_York"))
+    with pytest.raises(ValueError):
+        engine.compute(ny, "w", windows=(15,), price=price)
+    utc_price = price.assign(datetime=price["datetime"].dt.tz_localize("America/New_York").dt.tz_convert("UTC"))
+    feats = engine.compute(ny, "w", windows=(15,), price=utc_price)
+    assert feats["price"].tolist() == [100.0, 101.0, 102.0, 103.0]
+
+def test_feature_engine_ewm_matches_pandas(monkeypatch):
+    import numpy as np
+    from src.features import engine
+    monkeypatch.setattr(engine, "EWM_SPAN", 4.0)
+    rng = np.random.default_rng(1)
+    dt = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 10 * 3600, 300)), unit="s"))
+    v = rng.normal(size=300)
+    v[[0, 1, 50, 51, 200]] = np.nan
+    feats = engine.compute(pd.DataFrame({"datetime": dt, "v": v}), "v")
+    for w in engine.WINDOWS:
+        ref = pd.Series(v).ewm(halflife=pd.Timedelta(minutes=w), times=pd.DatetimeIndex(dt)).mean()
+        pd.testing.assert_series_equal(feats[f"ewm_{w}m"], ref, check_names=False, rtol=1e-9)
@@ -18,3 +18,50 @@ def test_normalize_sentiment():
     out = normalize_sentiment(df, "2024-01-01")
     assert out["confidence"].max() <= 1.0
     assert set(out["sentiment"].unique()).issubset({-1,0,1})
+
+def test_read_days_compact_schema(tmp_path):
+    from src.io import storage, schema
+    for d, src in [("2024-01-01", "coindesk"), ("2024-01-02", "decrypt")]:
+        storage.write_csv(pd.DataFrame([{"time":"12:00:00","headline":f"H {src}","sentiment":1,"confidence":0.5,"score":0.5}]), storage.sentiment_path(tmp_path, d))
+        storage.write_csv(pd.DataFrame([{"date":d,"time":"12:00:00","headline":"A","source":src,"link":"u","summary":"s"}]), storage.news_path(tmp_path, d))
+    dates = storage.date_range("2024-01-01", "2024-01-03")
+    sent = storage.read_days(tmp_path, "sentiment", dates)
+    assert len(sent) == 2 and list(sent["date"]) == ["2024-01-01", "2024-01-02"]
+    assert sent["sentiment"].dtype == "int8" and sent["confidence"].dtype == "float32"
+    news = storage.read_days(tmp_path, "news", dates)
+    assert isinstance(news["source"].dtype, pd.CategoricalDtype)
+    assert schema.memory_usage(news)["total"] > 0
+
+def test_search_index_incremental(tmp_path):
+    from src.io import search_index
+    conn = search_index.connect(tmp_path / "news.sqlite")
+    rows = [
+        {"date":"2024-01-01","time":"12:00:00","headline":"Bitcoin surges past record","source":"coindesk","link":"a","summary":"ETF inflows"},
+        {"date":"2024-01-02","time":"09:00:00","headline":"Exchange hack drains wallets","source":"decrypt","link":"b","summary":float("nan")},
+    ]
+    assert search_index.add_news(conn, rows) == 2
+    assert search_index.add_news(conn, rows[:1]) == 0
+    search_index.set_sentiment(conn, "2024-01-01", [{"headline":"Bitcoin surges past record","sentiment":1,"confidence":0.7}])
+    assert search_index.search(conn, "surge")["headline"].tolist() == ["Bitcoin surges past record"]
+    assert search_index.search(conn, "etf", sentiment=1)["source"].tolist() == ["coindesk"]
+    assert search_index.search(conn, "hack", start="2024-01-01", end="2024-01-01").empty
+    assert len(search_index.search(conn, "", start="2024-01-01")) == 2
+    assert search_index.search(conn, 'hack "wallets').shape[0] == 1
+
+def test_tag_and_split_assets():
+    from src.processing import assets
+    cfg = {"assets": {
+        "bitcoin": {"coinlore_id": 90, "keywords": ["bitcoin", "btc"], "default": True},
+        "ethereum": {"coinlore_id": 80, "keywords": ["ethereum", "eth"]},
+    }}
+    al = assets.from_config(cfg)
+    text = pd.Series(["BTC and ETH rally", "Ethereum upgrade ships", "Crypto market steady", "Bitcoinist recap"])
+    tags = assets.tag_assets(text, al)
+    assert tags.tolist() == ["bitcoin|ethereum", "ethereum", "bitcoin", "bitcoin"]
+    df = pd.DataFrame({"headline": text, "assets": tags})
+    parts = assets.split_by_asset(df)
+    assert len(parts["bitcoin"]) == 3 and len(parts["ethereum"]) == 2
+    del cfg["assets"]["bitcoin"]["default"]
+    al = assets.from_config(cfg)
+    assert assets.default_name(al) == "bitcoin"
+    assert assets.tag_assets(pd.Series(["Crypto market steady", "BTC gains"]), al).tolist() == ["bitcoin", "bitcoin"]
@@ -13,3 +13,53 @@ def test_ensemble_outputs():
     w = {"vader":0.35,"textblob":0.15,"transformer":0.0,"lexicon":0.5}
     s, c, parts = ensemble.analyze("BTC surges to record high", "bullish rally", w, threshold=0.03)
     assert s in (-1,0,1) and 0 <= c <= 1 and "combined" in parts
+
+def test_recombine_matches_ensemble():
+    import pandas as pd
+    from src.sentiment import recombine
+    w = {"vader":0.35,"textblob":0.15,"transformer":0.0,"lexicon":0.5}
+    s, c, parts = ensemble.analyze("BTC surges to record high", "bullish rally", w, threshold=0.03)
+    df = pd.DataFrame([{k: parts[k] for k in recombine.COMPONENTS}, {"vader": -0.2, "textblob": 0.0, "transformer": float("nan"), "lexicon": -1.0}])
+    out = recombine.recombine(df, w, 0.03)
+    assert abs(out["score"].iloc[0] - parts["combined"]) < 1e-9
+    assert out["sentiment"].tolist() == [s, -1] and abs(out["confidence"].iloc[0] - c) < 1e-9
+    flipped = recombine.recombine(df, {"vader": 0.0, "textblob": 0.0, "transformer": 0.0, "lexicon": -1.0}, 0.03)
+    assert flipped["sentiment"].tolist() == [-s, 1]
+
+def test_recombine_script_keeps_component_precision(tmp_path):
+    import importlib.util, pandas as pd
+    from pathlib import Path
+    root = Path(__file__).resolve().parents[1]
+    spec = importlib.util.spec_from_file_location("_recombine_script", root / "scripts" / "recombine.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    mod.DATA = tmp_path
+    path = tmp_path / "sentiment" / "sentiment_analysis_2024-01-01.csv"
+    path.parent.mkdir()
+    df = pd.DataFrame({"time": ["12:00:00", "12:05:00"], "headline": ["a", "b"],
+                       "vader": [0.123456789012, -0.3], "textblob": [0.1, 0.0],
+                       "transformer": [float("nan"), 0.7], "lexicon": [0.5, -0.8], "assets": ["bitcoin", "ethereum"]})
+    df.to_csv(path, index=False)
+    mod.main("2024-01-01", "2024-01-01", dict(mod.model_cfg["weights"]), 0.03)
+    mod.main("2024-01-01", "2024-01-01", dict(mod.model_cfg["weights"]), 0.03)
+    out = pd.read_csv(path)
+    from src.sentiment import recombine
+    pd.testing.assert_frame_equal(out[recombine.COMPONENTS], df[recombine.COMPONENTS], check_exact=True)
+
+def test_components_analyze_row():
+    import math
+    from src.sentiment import components, recombine
+    parts = components.analyze_row("BTC surges in bullish rally", "no crash")
+    assert list(parts) == recombine.COMPONENTS and math.isnan(parts["transformer"])
+    assert parts["lexicon"] == components.lex_score("BTC surges in bullish rally no crash") == 0.5*3 - 0.8
+    assert parts["vader"] == vader.score("BTC surges in bullish rally no crash")
+
+def test_recombine_owns_output_columns():
+    import pandas as pd
+    from src.sentiment import recombine
+    fresh = pd.DataFrame({"time": ["12:00:00"], "headline": ["a"], "vader": [0.5], "textblob": [0.0],
+                          "transformer": [float("nan")], "lexicon": [0.5]})
+    out = recombine.recombine(fresh, {}, 0.03)
+    assert list(out.columns) == ["time", "headline", *recombine.OUTPUTS, *recombine.COMPONENTS]
+    stored = out.assign(assets="bitcoin")
+    assert list(recombine.recombine(stored, {}, 0.03).columns) == list(stored.columns)